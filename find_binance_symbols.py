@@ -10,39 +10,86 @@ Usage:
     python find_binance_symbols.py --list-top 20                   # List top 20 by volume
     python find_binance_symbols.py --search bitcoin                # Search by name
     python find_binance_symbols.py --usdt-pairs                    # Show all USDT pairs
+    python find_binance_symbols.py --no-cache --list-top 20        # Skip the response cache
+
+API responses are cached under ~/.cache/cyd-binance (ticker data for 5 minutes,
+exchange info for 24 hours). Use --no-cache to force fresh data.
 """
 
-import requests
 import json
 import argparse
+import heapq
+import os
 import sys
+import time
+from collections import defaultdict
+from operator import itemgetter
+from pathlib import Path
 from typing import List, Dict, Any
 
+try:
+    import orjson  # Optional, several times faster on the ~1 MB exchangeInfo payload
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'cyd-binance'
+EXCHANGE_INFO_TTL = 24 * 60 * 60  # Trading pairs rarely change
+TICKER_TTL = 5 * 60               # Prices and volumes go stale quickly
+
+POPULAR_BASE_ASSETS = ('BTC', 'ETH', 'BNB', 'ADA', 'SOL', 'DOGE', 'MATIC', 'DOT', 'AVAX', 'LINK')
+
 class BinanceSymbolFinder:
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
+        # Imported here so --help and argument errors don't pay for loading requests
+        import requests
+
+        self.request_error = requests.RequestException
         self.base_url = "https://api.binance.com/api/v3"
+        self.use_cache = use_cache
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'CYD-Crypto-Ticker/1.0'
         })
 
+    def _cached_get(self, name: str, endpoint: str, ttl: int) -> Any:
+        """Fetch an API endpoint, reusing a cached copy on disk if younger than ttl seconds"""
+        cache_file = CACHE_DIR / f"{name}.json"
+        if self.use_cache:
+            try:
+                if time.time() - cache_file.stat().st_mtime < ttl:
+                    return json_loads(cache_file.read_bytes())
+            except (OSError, ValueError):
+                pass  # Missing or corrupt cache entry, fall through to the network
+
+        response = self.session.get(f"{self.base_url}/{endpoint}", timeout=10)
+        response.raise_for_status()
+        # Parse before caching so a non-JSON body (captive portal, proxy error page)
+        # is never stored; callers report the ValueError like a request error
+        data = json_loads(response.content)
+
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, 'wb') as f:
+                f.write(response.content)
+        except OSError:
+            pass  # Caching is best-effort
+
+        return data
+
     def get_exchange_info(self) -> Dict[str, Any]:
         """Get exchange information including all trading pairs"""
         try:
-            response = self.session.get(f"{self.base_url}/exchangeInfo", timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return self._cached_get('exchangeInfo', 'exchangeInfo', EXCHANGE_INFO_TTL)
+        except (self.request_error, ValueError) as e:
             print(f"Error fetching exchange info: {e}")
             return {}
 
     def get_24hr_ticker(self) -> List[Dict[str, Any]]:
         """Get 24hr ticker statistics for all trading pairs"""
         try:
-            response = self.session.get(f"{self.base_url}/ticker/24hr", timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return self._cached_get('ticker_24hr', 'ticker/24hr', TICKER_TTL)
+        except (self.request_error, ValueError) as e:
             print(f"Error fetching ticker data: {e}")
             return []
 
@@ -55,36 +102,39 @@ class BinanceSymbolFinder:
         if not exchange_info:
             return
             
-        trading_pairs = exchange_info.get('symbols', [])
+        # Index active pairs once so each lookup doesn't rescan the whole exchange
+        by_symbol = {}
+        by_base = defaultdict(list)
+        for pair in exchange_info.get('symbols', []):
+            if pair['status'] == 'TRADING':
+                by_symbol[pair['symbol']] = pair
+                by_base[pair['baseAsset']].append(pair)
         found_pairs = []
         
         for symbol_search in symbols:
             symbol_upper = symbol_search.upper()
             matches = []
             
-            # Look for exact matches and partial matches
-            for pair in trading_pairs:
-                if pair['status'] != 'TRADING':
+            # Exact symbol match
+            exact = by_symbol.get(symbol_upper)
+            if exact:
+                matches.append((exact['symbol'], exact['baseAsset'], exact['quoteAsset'], 'exact'))
+            
+            # Base asset matches, USDT pairs ahead of other quotes
+            other_pairs = []
+            for pair in by_base.get(symbol_upper, []):
+                if pair is exact:
                     continue
-                    
                 symbol = pair['symbol']
-                base = pair['baseAsset']
                 quote = pair['quoteAsset']
-                
-                # Exact symbol match
-                if symbol == symbol_upper:
-                    matches.append((symbol, base, quote, 'exact'))
-                # Base asset match with USDT
-                elif base == symbol_upper and quote == 'USDT':
-                    matches.append((symbol, base, quote, 'usdt_pair'))
-                # Base asset match with other quotes
-                elif base == symbol_upper:
-                    matches.append((symbol, base, quote, 'other_pair'))
+                if quote == 'USDT':
+                    matches.append((symbol, symbol_upper, quote, 'usdt_pair'))
+                else:
+                    other_pairs.append((symbol, symbol_upper, quote, 'other_pair'))
+            matches.extend(other_pairs)
             
             if matches:
                 print(f"\nFound matches for '{symbol_search}':")
-                # Sort by match type priority
-                matches.sort(key=lambda x: {'exact': 0, 'usdt_pair': 1, 'other_pair': 2}[x[3]])
                 
                 for symbol, base, quote, match_type in matches[:10]:  # Limit to 10 matches
                     found_pairs.append(symbol)
@@ -115,20 +165,20 @@ class BinanceSymbolFinder:
         if not ticker_data:
             return
             
-        # Filter for USDT pairs and sort by volume
-        usdt_pairs = [
-            ticker for ticker in ticker_data 
-            if ticker['symbol'].endswith('USDT')
-        ]
-        
-        # Sort by quote volume (USDT volume)
-        usdt_pairs.sort(key=lambda x: float(x['quoteVolume']), reverse=True)
+        # Top `count` USDT pairs by quote volume, parsing each volume only once
+        top = heapq.nlargest(
+            count,
+            ((float(ticker['quoteVolume']), ticker) for ticker in ticker_data
+             if ticker['symbol'].endswith('USDT')),
+            key=itemgetter(0)
+        )
+        usdt_pairs = [ticker for _, ticker in top]
         
         print(f"{'Symbol':<15} {'Price (USDT)':<15} {'24h Change':<15} {'Volume (USDT)':<20}")
         print("-" * 75)
         
         symbols_for_config = []
-        for i, ticker in enumerate(usdt_pairs[:count]):
+        for i, ticker in enumerate(usdt_pairs):
             symbol = ticker['symbol']
             price = float(ticker['lastPrice'])
             change_percent = float(ticker['priceChangePercent'])
@@ -157,10 +207,6 @@ class BinanceSymbolFinder:
         print(f"Searching for cryptocurrencies matching '{search_term}':")
         print("-" * 50)
         
-        # Get ticker data to show current prices
-        ticker_data = self.get_24hr_ticker()
-        ticker_dict = {ticker['symbol']: ticker for ticker in ticker_data}
-        
         exchange_info = self.get_exchange_info()
         if not exchange_info:
             return
@@ -195,11 +241,17 @@ class BinanceSymbolFinder:
             if pair['status'] != 'TRADING':
                 continue
             if pair['baseAsset'] in base_assets and pair['quoteAsset'] == 'USDT':
-                symbol = pair['symbol']
-                ticker = ticker_dict.get(symbol, {})
-                matches.append((symbol, pair['baseAsset'], ticker))
+                matches.append((pair['symbol'], pair['baseAsset']))
         
         if matches:
+            # Get ticker data to show current prices, indexing only the matched pairs
+            wanted = {symbol for symbol, _ in matches}
+            ticker_dict = {
+                ticker['symbol']: ticker for ticker in self.get_24hr_ticker()
+                if ticker['symbol'] in wanted
+            }
+            matches = [(symbol, base, ticker_dict.get(symbol, {})) for symbol, base in matches]
+            
             # Sort by volume if available
             matches.sort(key=lambda x: float(x[2].get('quoteVolume', 0)), reverse=True)
             
@@ -252,15 +304,19 @@ class BinanceSymbolFinder:
             print(f"\n... and {len(usdt_pairs) - 100} more pairs")
         
         # Suggest popular pairs
-        popular_pairs = [pair for pair in usdt_pairs if any(
-            pair.startswith(symbol) for symbol in 
-            ['BTC', 'ETH', 'BNB', 'ADA', 'SOL', 'DOGE', 'MATIC', 'DOT', 'AVAX', 'LINK']
-        )]
+        popular_pairs = [pair for pair in usdt_pairs if pair.startswith(POPULAR_BASE_ASSETS)]
         
         if popular_pairs:
             print(f"\n📝 Popular pairs for CYD configuration:")
             print(f"   {','.join(popular_pairs[:6])}")
 
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
 def main():
     parser = argparse.ArgumentParser(
         description='Find Binance trading pairs for CYD Crypto Ticker configuration',
@@ -271,20 +327,23 @@ Examples:
   python find_binance_symbols.py --list-top 20                  # List top 20 by volume  
   python find_binance_symbols.py --search bitcoin               # Search by name
   python find_binance_symbols.py --usdt-pairs                   # Show all USDT pairs
+  python find_binance_symbols.py --no-cache --list-top 20       # Skip the response cache
         """
     )
     
     parser.add_argument('symbols', nargs='*', help='Cryptocurrency symbols to find')
-    parser.add_argument('--list-top', type=int, metavar='N', 
+    parser.add_argument('--list-top', type=positive_int, metavar='N', 
                        help='List top N trading pairs by volume')
     parser.add_argument('--search', metavar='TERM', 
                        help='Search for trading pairs by cryptocurrency name')
     parser.add_argument('--usdt-pairs', action='store_true',
                        help='Show all available USDT trading pairs')
+    parser.add_argument('--no-cache', action='store_true',
+                       help=f'Bypass the local API response cache ({CACHE_DIR})')
     
     args = parser.parse_args()
     
-    finder = BinanceSymbolFinder()
+    finder = BinanceSymbolFinder(use_cache=not args.no_cache)
     
     if args.list_top:
         finder.list_top_pairs(args.list_top)